@@ -0,0 +1,97 @@
+"""Compare per-call CPU time and memory of the plain and compiled request paths.
+
+No network is used: the HTTP round-trip is replaced by a canned response
+so only request building and response handling are measured.
+
+    python benchmarks/bench_compiled.py [calls]
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from generate_prompts import PromptConfig, compile_config, extend_prompt, generate_example_prompts
+from generate_prompts import client as client_module
+
+_GENERATE_REPLY = {"choices": [{"message": {"content": '["one", "two", "three"]'}}]}
+_EXTEND_REPLY = {"choices": [{"message": {"content": "An enhanced prompt."}}]}
+
+CONFIG = PromptConfig(
+    system_prompt=" ".join(["Generate exactly 3 simple, minimal prompts."] * 20),
+    user_prompt=" ".join(["Create three diverse prompts under 140 characters."] * 20),
+    extend_system_prompt=" ".join(["You improve prompts by adding vivid detail."] * 20),
+    fallback_pool=["a", "b", "c"],
+)
+PROMPT = "A cat exploring a sunlit garden in slow motion"
+
+
+def _fake_post(
+    url: str, data: bytes, headers: dict[str, str], timeout: float, cancel=None
+) -> dict:
+    return _EXTEND_REPLY if b"vivid detail" in data else _GENERATE_REPLY
+
+
+def _check(name: str, fn, expected) -> None:
+    """Fail if *fn* does not go through the stub (e.g. it silently fell back)."""
+    result = fn()
+    if result != expected:
+        sys.exit(f"{name}: expected {expected!r} from the stubbed LLM, got {result!r}")
+
+
+def _measure(fn, calls: int) -> tuple[float, float]:
+    """Return (CPU microseconds per call, peak traced KiB per call)."""
+    for _ in range(min(calls, 200)):
+        fn()
+    start = time.process_time()
+    for _ in range(calls):
+        fn()
+    cpu = (time.process_time() - start) / calls * 1e6
+
+    tracemalloc.start()
+    peaks = []
+    for _ in range(min(calls, 2000)):
+        tracemalloc.reset_peak()
+        base = tracemalloc.get_traced_memory()[0]
+        fn()
+        peaks.append(tracemalloc.get_traced_memory()[1] - base)
+    tracemalloc.stop()
+    return cpu, sum(peaks) / len(peaks) / 1024
+
+
+def main() -> None:
+    calls = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    client_module._post_bytes = _fake_post
+    compiled = compile_config(CONFIG)
+
+    cases = {
+        "generate": (
+            lambda: generate_example_prompts(CONFIG),
+            compiled.generate,
+        ),
+        "extend": (
+            lambda: extend_prompt(PROMPT, CONFIG),
+            lambda: compiled.extend(PROMPT),
+        ),
+    }
+    expected = {"generate": ["one", "two", "three"], "extend": "An enhanced prompt."}
+    for name, (plain, fast) in cases.items():
+        _check(f"{name} (plain)", plain, expected[name])
+        _check(f"{name} (compiled)", fast, expected[name])
+
+    print(f"{calls} calls per case\n")
+    print(f"{'case':<10}{'path':<10}{'cpu us/call':>14}{'peak KiB/call':>16}")
+    for name, (plain, fast) in cases.items():
+        plain_cpu, plain_mem = _measure(plain, calls)
+        fast_cpu, fast_mem = _measure(fast, calls)
+        print(f"{name:<10}{'plain':<10}{plain_cpu:>14.2f}{plain_mem:>16.2f}")
+        print(f"{name:<10}{'compiled':<10}{fast_cpu:>14.2f}{fast_mem:>16.2f}")
+        print(f"{'':<10}{'speedup':<10}{plain_cpu / fast_cpu:>13.2f}x{plain_mem / fast_mem:>15.2f}x")
+
+
+if __name__ == "__main__":
+    main()
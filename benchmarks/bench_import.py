@@ -0,0 +1,87 @@
+"""Measure cold import time of the package and check it against a budget.
+
+Each target is imported in a fresh interpreter with ``-X importtime``;
+the cumulative time of the top-level module is reported (median of
+*runs*).  The script also verifies that a bare package import stays
+side-effect free: no ``.env`` loading and no HTTP/server modules.
+
+    python benchmarks/bench_import.py [--runs N] [--check]
+
+With ``--check`` the exit status is 1 if any target exceeds its budget
+or the side-effect check fails, so it can gate CI.
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Cumulative import time budgets in milliseconds.  Generous enough for a
+# slow CI runner; an eager package import (~75 ms) exceeds the first two.
+BUDGETS_MS = {
+    "generate_prompts": 35.0,
+    "generate_prompts.normalizer": 40.0,
+    "generate_prompts.generator": 120.0,
+}
+
+# Modules that must not be loaded by ``import generate_prompts`` alone.
+FORBIDDEN = ("dotenv", "http.client", "urllib.request", "http.server", "generate_prompts.config")
+
+
+def _import_ms(module: str) -> float:
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    # Lines look like "import time:   self |  cumulative | name".
+    for line in reversed(result.stderr.splitlines()):
+        _, cumulative, name = line.split("|")
+        if name.strip() == module:
+            return int(cumulative) / 1000
+    raise RuntimeError(f"no importtime entry for {module}")
+
+
+def _loaded_forbidden() -> list[str]:
+    code = (
+        "import sys, generate_prompts;"
+        f"print(','.join(m for m in {FORBIDDEN!r} if m in sys.modules))"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, check=True
+    ).stdout.strip()
+    return [m for m in out.split(",") if m]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=7)
+    parser.add_argument("--check", action="store_true", help="exit 1 when over budget")
+    args = parser.parse_args()
+
+    failed = False
+    print(f"{'module':<32}{'median ms':>12}{'budget ms':>12}")
+    for module, budget in BUDGETS_MS.items():
+        median = statistics.median(_import_ms(module) for _ in range(args.runs))
+        over = median > budget
+        failed |= over
+        print(f"{module:<32}{median:>12.1f}{budget:>12.1f}{'  OVER' if over else ''}")
+
+    loaded = _loaded_forbidden()
+    if loaded:
+        failed = True
+        print(f"\n'import generate_prompts' loaded: {', '.join(loaded)}")
+
+    if args.check and failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""Build prompt corpora offline for use as ``fallback_pool`` lists.
+
+Example::
+
+    python build_corpus.py configs.json -o corpus.jsonl --target 200 --extend
+
+Rerun the same command to resume an interrupted run.
+"""
+
+from __future__ import annotations
+
+import argparse
+
+from generate_prompts import build_corpus, load_prompt_configs
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("configs", help="JSON file mapping names to PromptConfig fields")
+    parser.add_argument("-o", "--output", required=True, help="corpus JSONL file (appended to)")
+    parser.add_argument("--target", type=int, required=True, help="unique prompts per config")
+    parser.add_argument("--only", action="append", metavar="NAME", help="restrict to this config (repeatable)")
+    parser.add_argument("--extend", action="store_true", help="also store an extended version of each prompt")
+    parser.add_argument("--workers", type=int, default=8, help="concurrent LLM requests")
+    parser.add_argument(
+        "--max-stale-rounds",
+        type=int,
+        default=20,
+        help="give up on a config after this many calls without a new prompt",
+    )
+    args = parser.parse_args()
+
+    configs = load_prompt_configs(args.configs)
+    if args.only:
+        unknown = set(args.only) - configs.keys()
+        if unknown:
+            parser.error(f"unknown config(s): {', '.join(sorted(unknown))}")
+        configs = {name: configs[name] for name in args.only}
+
+    def report(record: dict[str, str]) -> None:
+        print(f"[{record['config']}] {record['prompt']}")
+
+    try:
+        counts = build_corpus(
+            configs,
+            args.output,
+            target=args.target,
+            extend=args.extend,
+            workers=args.workers,
+            max_stale_rounds=args.max_stale_rounds,
+            on_record=report,
+        )
+    except KeyboardInterrupt:
+        print("\nInterrupted — rerun the same command to resume.")
+        raise SystemExit(130)
+
+    print()
+    for name, count in counts.items():
+        status = "done" if count >= args.target else "incomplete"
+        print(f"{name}: {count}/{args.target} ({status})")
+
+
+if __name__ == "__main__":
+    main()
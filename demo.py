@@ -5,7 +5,7 @@ from __future__ import annotations
 import streamlit as st
 
 from generate_prompts import PromptConfig, build_animation_frames, extend_prompt, generate_example_prompts
-from generate_prompts.streamlit_component import inject_slot_css, render_prompt_cards
+from generate_prompts.streamlit_component import inject_slot_css, render_prompt_cards, run_cancellable
 
 # ---------------------------------------------------------------------------
 # Domain configs
@@ -99,7 +99,7 @@ config = DOMAINS[domain]
 # ---------------------------------------------------------------------------
 if st.button("Generate Prompts", type="primary"):
     with st.spinner("Generating..."):
-        prompts = generate_example_prompts(config)
+        prompts = run_cancellable(generate_example_prompts, config, key="generate")
     st.session_state["prompts"] = prompts
     st.session_state["domain"] = domain
     # Build animation frames from fallback -> generated
@@ -147,7 +147,7 @@ user_input = st.text_area(
 if st.button("Extend", disabled=not user_input.strip()):
     with st.spinner("Extending..."):
         try:
-            enhanced = extend_prompt(user_input.strip(), config)
+            enhanced = run_cancellable(extend_prompt, user_input.strip(), config, key="extend")
             st.success("Extended prompt:")
             st.markdown(f"> {enhanced}")
         except RuntimeError as exc:
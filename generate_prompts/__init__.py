@@ -1,23 +1,99 @@
-"""Reusable LLM prompt generator & extender library."""
+"""Reusable LLM prompt generator & extender library.
 
-from .animation import AnimationFrame, build_animation_frames, render_animated_card, render_slot_css, render_static_card
-from .config import LLMSettings, PromptConfig
-from .client import LLMClient
-from .extender import extend_prompt
-from .generator import generate_example_prompts
-from .normalizer import normalize_prompts, random_sample_prompts
+Public names are imported lazily on first access, so importing the
+package (or a light submodule such as :mod:`.normalizer`) does not pay
+for the HTTP client, server or animation modules it does not use.
+"""
+
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .animation import AnimationFrame, build_animation_frames, render_animated_card, render_slot_css, render_static_card
+    from .cancellation import CancelHandle, RequestCancelled
+    from .client import LLMClient, RemoteLLMClient
+    from .compiled import CompiledConfig, compile_config
+    from .config import LLMSettings, PromptConfig, check_extend_template, load_prompt_configs
+    from .corpus import build_corpus, load_fallback_pool, read_corpus
+    from .extender import extend_prompt
+    from .generator import generate_example_prompts
+    from .normalizer import normalize_prompts, random_sample_prompts
+    from .server import PromptService, RateLimiter, UnknownConfigError, make_server
+    from .similarity_cache import CacheStats, SimilarityCache
+
+_EXPORTS = {
+    "AnimationFrame": "animation",
+    "build_animation_frames": "animation",
+    "render_animated_card": "animation",
+    "render_slot_css": "animation",
+    "render_static_card": "animation",
+    "CancelHandle": "cancellation",
+    "RequestCancelled": "cancellation",
+    "LLMClient": "client",
+    "RemoteLLMClient": "client",
+    "CompiledConfig": "compiled",
+    "compile_config": "compiled",
+    "LLMSettings": "config",
+    "PromptConfig": "config",
+    "check_extend_template": "config",
+    "load_prompt_configs": "config",
+    "build_corpus": "corpus",
+    "load_fallback_pool": "corpus",
+    "read_corpus": "corpus",
+    "extend_prompt": "extender",
+    "generate_example_prompts": "generator",
+    "normalize_prompts": "normalizer",
+    "random_sample_prompts": "normalizer",
+    "PromptService": "server",
+    "RateLimiter": "server",
+    "UnknownConfigError": "server",
+    "make_server": "server",
+    "CacheStats": "similarity_cache",
+    "SimilarityCache": "similarity_cache",
+}
 
 __all__ = [
     "AnimationFrame",
+    "CacheStats",
+    "CancelHandle",
+    "CompiledConfig",
     "LLMClient",
     "LLMSettings",
     "PromptConfig",
+    "PromptService",
+    "RateLimiter",
+    "RemoteLLMClient",
+    "RequestCancelled",
+    "SimilarityCache",
+    "UnknownConfigError",
     "build_animation_frames",
+    "build_corpus",
+    "check_extend_template",
+    "compile_config",
     "extend_prompt",
     "generate_example_prompts",
+    "load_fallback_pool",
+    "load_prompt_configs",
+    "make_server",
     "normalize_prompts",
     "random_sample_prompts",
+    "read_corpus",
     "render_animated_card",
     "render_slot_css",
     "render_static_card",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,50 @@
+"""Command-line entry point: ``python -m generate_prompts serve``."""
+
+from __future__ import annotations
+
+import argparse
+
+from .config import load_prompt_configs
+from .server import PromptService, RateLimiter, make_server
+from .similarity_cache import SimilarityCache
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m generate_prompts")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    serve = commands.add_parser("serve", help="run the shared prompt service")
+    serve.add_argument("configs", help="JSON file mapping names to PromptConfig fields")
+    serve.add_argument("--host", default="127.0.0.1")
+    serve.add_argument("--port", type=int, default=8080)
+    serve.add_argument("--rate", type=float, default=0.0, help="upstream calls per second (0 = unlimited)")
+    serve.add_argument("--burst", type=int, default=10, help="calls allowed in a burst above --rate")
+    serve.add_argument("--max-concurrency", type=int, default=16, help="upstream calls in flight")
+    serve.add_argument("--cache-size", type=int, default=1024, help="extend cache entries (0 disables)")
+    serve.add_argument("--cache-threshold", type=float, default=0.8, help="extend cache similarity threshold")
+    serve.add_argument("--quiet", action="store_true", help="do not log requests")
+    args = parser.parse_args(argv)
+    if args.max_concurrency < 1:
+        parser.error("--max-concurrency must be at least 1")
+
+    service = PromptService(
+        load_prompt_configs(args.configs),
+        limiter=RateLimiter(args.rate, args.burst, args.max_concurrency),
+        cache=(
+            SimilarityCache(args.cache_threshold, args.cache_size)
+            if args.cache_size > 0
+            else None
+        ),
+    )
+    server = make_server(service, args.host, args.port, quiet=args.quiet)
+    print(f"Serving {len(service.configs)} config(s) on http://{args.host}:{args.port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+"""Cancellation handles for in-flight LLM requests."""
+
+from __future__ import annotations
+
+import functools
+import threading
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    import http.client
+    import socket
+    import urllib.request
+
+
+class RequestCancelled(RuntimeError):
+    """Raised by a request whose :class:`CancelHandle` was cancelled."""
+
+
+class CancelHandle:
+    """Cancels the requests it is passed to, closing their sockets promptly.
+
+    Pass the same handle as ``cancel=`` to any number of calls; once
+    :meth:`cancel` is called, calls that have not started raise
+    :class:`RequestCancelled` immediately and calls in flight have their
+    socket shut down, so the blocked thread raises instead of waiting
+    for the response or the timeout.  A handle cannot be reset.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._cancelled = False
+        self._sockets: set[socket.socket] = set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled
+
+    def cancel(self) -> None:
+        """Cancel all current and future requests using this handle."""
+        with self._lock:
+            self._cancelled = True
+            sockets, self._sockets = self._sockets, set()
+        for sock in sockets:
+            _shutdown(sock)
+
+    def raise_if_cancelled(self) -> None:
+        if self._cancelled:
+            raise RequestCancelled("LLM request cancelled")
+
+    def _track(self, conn: http.client.HTTPConnection) -> None:
+        """Register *conn*'s socket as soon as it connects."""
+        connect = conn.connect
+
+        def tracked_connect() -> None:
+            self.raise_if_cancelled()
+            connect()
+            with self._lock:
+                if not self._cancelled:
+                    self._sockets.add(conn.sock)
+                    return
+            conn.close()
+            self.raise_if_cancelled()
+
+        conn.connect = tracked_connect  # type: ignore[method-assign]
+
+    def _prune(self) -> None:
+        """Forget sockets of requests that have finished."""
+        with self._lock:
+            self._sockets = {s for s in self._sockets if s.fileno() != -1}
+
+    def opener(self) -> urllib.request.OpenerDirector:
+        """Return a :mod:`urllib` opener whose connections this handle can close."""
+        import urllib.request
+
+        http_handler, https_handler = _handler_classes()
+        return urllib.request.build_opener(http_handler(self), https_handler(self))
+
+
+def _shutdown(sock: socket.socket) -> None:
+    # shutdown() wakes a thread blocked in recv() even while the response
+    # object still holds a reference to the socket; close() alone does not.
+    import socket
+
+    try:
+        sock.shutdown(socket.SHUT_RDWR)
+    except OSError:
+        pass
+    sock.close()
+
+
+@functools.cache
+def _handler_classes() -> tuple[type, type]:
+    # Built on first use so importing this module does not import urllib.
+    import urllib.request
+
+    class _Tracking:
+        def __init__(self, handle: CancelHandle) -> None:
+            super().__init__()
+            self._cancel_handle = handle
+
+        def do_open(self, http_class: Any, req: Any, **kwargs: Any) -> Any:
+            handle = self._cancel_handle
+
+            def connection(*args: Any, **conn_kwargs: Any) -> Any:
+                conn = http_class(*args, **conn_kwargs)
+                handle._track(conn)
+                return conn
+
+            return super().do_open(connection, req, **kwargs)
+
+    class _HTTPHandler(_Tracking, urllib.request.HTTPHandler):
+        pass
+
+    class _HTTPSHandler(_Tracking, urllib.request.HTTPSHandler):
+        pass
+
+    return _HTTPHandler, _HTTPSHandler
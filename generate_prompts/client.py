@@ -3,55 +3,116 @@
 from __future__ import annotations
 
 import json
-import urllib.error
-import urllib.request
 from typing import TYPE_CHECKING
 
+from .cancellation import RequestCancelled
+
 if TYPE_CHECKING:
+    from .cancellation import CancelHandle
     from .config import LLMSettings
 
 
+def _post_json(
+    url: str,
+    payload: dict,
+    headers: dict[str, str],
+    timeout: float,
+    cancel: CancelHandle | None = None,
+) -> dict:
+    """POST *payload* as JSON and return the decoded JSON response body."""
+    return _post_bytes(
+        url, json.dumps(payload).encode("utf-8"), headers, timeout, cancel
+    )
+
+
+def _post_bytes(
+    url: str,
+    data: bytes,
+    headers: dict[str, str],
+    timeout: float,
+    cancel: CancelHandle | None = None,
+) -> dict:
+    """POST an already-encoded JSON body and return the decoded response.
+
+    If *cancel* is cancelled before or during the request,
+    :class:`RequestCancelled` is raised.
+    """
+    # urllib.request pulls in http.client and email parsing; import it on
+    # first use so importing the package stays cheap.
+    import urllib.error
+    import urllib.request
+
+    req = urllib.request.Request(
+        url,
+        data=data,
+        headers=headers,
+        method="POST",
+    )
+
+    if cancel is None:
+        open_url = urllib.request.urlopen
+    else:
+        cancel.raise_if_cancelled()
+        open_url = cancel.opener().open
+
+    try:
+        with open_url(req, timeout=timeout) as response:
+            return json.loads(response.read().decode("utf-8"))
+    except urllib.error.HTTPError as exc:
+        detail = exc.read().decode("utf-8", errors="ignore")
+        raise RuntimeError(
+            f"LLM request failed ({exc.code}): {detail[:400]}"
+        ) from exc
+    except RequestCancelled:
+        raise
+    except Exception as exc:
+        if cancel is not None and cancel.cancelled:
+            raise RequestCancelled("LLM request cancelled") from exc
+        raise RuntimeError(f"LLM request failed: {exc}") from exc
+    finally:
+        if cancel is not None:
+            cancel._prune()
+
+
 class LLMClient:
     """Minimal OpenAI-compatible chat client using only :mod:`urllib`."""
 
     def __init__(self, settings: LLMSettings) -> None:
         self._settings = settings
         self._endpoint = f"{settings.base_url.rstrip('/')}/chat/completions"
+        self._headers: dict[str, str] = {"Content-Type": "application/json"}
+        if settings.api_key:
+            self._headers["Authorization"] = f"Bearer {settings.api_key}"
 
     def chat(
         self,
         messages: list[dict[str, str]],
         temperature: float | None = None,
+        cancel: CancelHandle | None = None,
     ) -> str:
-        """Send a chat completion request and return the assistant text."""
+        """Send a chat completion request and return the assistant text.
+
+        Cancelling *cancel* closes the connection and raises
+        :class:`RequestCancelled` (a :class:`RuntimeError`).
+        """
         payload = {
             "model": self._settings.model,
             "temperature": temperature if temperature is not None else 0.7,
             "messages": messages,
         }
-        headers: dict[str, str] = {"Content-Type": "application/json"}
-        if self._settings.api_key:
-            headers["Authorization"] = f"Bearer {self._settings.api_key}"
-
-        req = urllib.request.Request(
-            self._endpoint,
-            data=json.dumps(payload).encode("utf-8"),
-            headers=headers,
-            method="POST",
-        )
+        return self.chat_encoded(json.dumps(payload).encode("utf-8"), cancel)
+
+    def chat_encoded(
+        self, data: bytes, cancel: CancelHandle | None = None
+    ) -> str:
+        """Send a pre-encoded chat completion body and return the assistant text.
 
-        try:
-            with urllib.request.urlopen(
-                req, timeout=self._settings.timeout
-            ) as response:
-                body = json.loads(response.read().decode("utf-8"))
-        except urllib.error.HTTPError as exc:
-            detail = exc.read().decode("utf-8", errors="ignore")
-            raise RuntimeError(
-                f"LLM request failed ({exc.code}): {detail[:400]}"
-            ) from exc
-        except Exception as exc:
-            raise RuntimeError(f"LLM request failed: {exc}") from exc
+        Used by :mod:`.compiled` to skip rebuilding and re-serialising
+        the constant parts of the request on every call.
+        """
+        body = _post_bytes(
+            self._endpoint, data, self._headers, self._settings.timeout, cancel
+        )
 
         choices = body.get("choices", [])
         if not choices:
@@ -70,3 +131,60 @@ class LLMClient:
         if not text:
             raise RuntimeError("LLM returned an empty response")
         return text
+
+
+class RemoteLLMClient:
+    """Client for a ``python -m generate_prompts serve`` prompt service.
+
+    Implements the same :meth:`chat` interface as :class:`LLMClient`, so
+    it can be passed as ``client=`` to :func:`generate_example_prompts`
+    and :func:`extend_prompt`; the service forwards the call through its
+    shared client and rate limiter.  :meth:`generate` and :meth:`extend`
+    run the whole operation server-side for a named config, which also
+    uses the service's shared extension cache.
+
+    Cancelling a call's *cancel* handle closes its connection to the
+    service, which then cancels the upstream LLM request it was making.
+    """
+
+    def __init__(self, base_url: str, timeout: float = 45) -> None:
+        self._base_url = base_url.rstrip("/")
+        self._timeout = timeout
+
+    def _call(
+        self, path: str, payload: dict, cancel: CancelHandle | None = None
+    ) -> dict:
+        return _post_json(
+            f"{self._base_url}{path}",
+            payload,
+            {"Content-Type": "application/json"},
+            self._timeout,
+            cancel,
+        )
+
+    def chat(
+        self,
+        messages: list[dict[str, str]],
+        temperature: float | None = None,
+        cancel: CancelHandle | None = None,
+    ) -> str:
+        """Send a chat completion through the service and return the text."""
+        body = self._call(
+            "/chat", {"messages": messages, "temperature": temperature}, cancel
+        )
+        return body["text"]
+
+    def generate(
+        self, config_name: str, cancel: CancelHandle | None = None
+    ) -> list[str]:
+        """Generate example prompts for the service config *config_name*."""
+        return self._call("/generate", {"config": config_name}, cancel)["prompts"]
+
+    def extend(
+        self, prompt: str, config_name: str, cancel: CancelHandle | None = None
+    ) -> str:
+        """Extend *prompt* with the service config *config_name*."""
+        body = self._call(
+            "/extend", {"config": config_name, "prompt": prompt}, cancel
+        )
+        return body["prompt"]
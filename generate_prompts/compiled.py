@@ -0,0 +1,175 @@
+"""Pre-encoded request templates for high-rate generate/extend calls."""
+
+from __future__ import annotations
+
+import json
+import string
+from typing import TYPE_CHECKING
+
+from .client import LLMClient
+from .config import LLMSettings, PromptConfig
+from .extender import _cache_namespace
+from .generator import _parse_generated
+from .normalizer import random_sample_prompts
+
+if TYPE_CHECKING:
+    from .cancellation import CancelHandle
+    from .similarity_cache import SimilarityCache
+
+
+def _json_str(text: str) -> bytes:
+    """Return *text* JSON-escaped, without the surrounding quotes."""
+    return json.dumps(text)[1:-1].encode("utf-8")
+
+
+def _split_template(template: str) -> tuple[str, str] | None:
+    """Split a template with a single bare ``{prompt}`` field into its literals.
+
+    Returns ``None`` for anything else (other fields, conversions or
+    format specs), which is then formatted per call instead.
+    """
+    parts = list(string.Formatter().parse(template))
+    fields = [(name, spec, conv) for _, name, spec, conv in parts if name is not None]
+    if fields != [("prompt", "", None)]:
+        return None
+    before: list[str] = []
+    after: list[str] = []
+    target = before
+    for literal, name, _, _ in parts:
+        target.append(literal)
+        if name is not None:
+            target = after
+    return "".join(before), "".join(after)
+
+
+class CompiledConfig:
+    """A (:class:`PromptConfig`, :class:`LLMSettings`) pair compiled once.
+
+    Compiling snapshots both objects: the generate request body is
+    encoded in full, and the extend request body is split around the
+    ``{prompt}`` placeholder, so a call only JSON-escapes the user's
+    prompt and joins three byte strings.  The settings are resolved
+    once instead of re-reading the environment on every call.
+
+    Later changes to the config or settings objects are not picked up;
+    compile again instead.  Behaviour otherwise matches
+    :func:`generate_example_prompts` and :func:`extend_prompt`.
+    Clients without a ``chat_encoded`` method (e.g. test doubles or
+    :class:`RemoteLLMClient`) are sent regular ``chat`` calls.
+    """
+
+    def __init__(
+        self,
+        config: PromptConfig,
+        llm_settings: LLMSettings | None = None,
+        client: LLMClient | None = None,
+    ) -> None:
+        self.config = config
+        self.settings = llm_settings or LLMSettings()
+        self.client = client or LLMClient(self.settings)
+        self.cache_namespace = _cache_namespace(config, self.settings)
+
+        self._generate_messages = [
+            {"role": "system", "content": config.system_prompt},
+            {"role": "user", "content": config.user_prompt},
+        ]
+        self._generate_body = json.dumps(
+            {
+                "model": self.settings.model,
+                "temperature": self.settings.generate_temperature,
+                "messages": self._generate_messages,
+            }
+        ).encode("utf-8")
+
+        self._extend_literals = _split_template(config.extend_user_template)
+        head = json.dumps(
+            {
+                "model": self.settings.model,
+                "temperature": self.settings.extend_temperature,
+                "messages": [
+                    {"role": "system", "content": config.extend_system_prompt},
+                    {"role": "user", "content": ""},
+                ],
+            }
+        ).encode("utf-8")
+        # Split the encoded body at the (empty) user content string.
+        cut = head.rindex(b'""') + 1
+        self._extend_head, self._extend_tail = head[:cut], head[cut:]
+        if self._extend_literals is not None:
+            before, after = self._extend_literals
+            self._extend_head += _json_str(before)
+            self._extend_tail = _json_str(after) + self._extend_tail
+
+    def encode_extend(self, prompt: str) -> bytes:
+        """Return the encoded extend request body for *prompt*."""
+        if self._extend_literals is not None:
+            return self._extend_head + _json_str(prompt) + self._extend_tail
+        content = self.config.extend_user_template.format(prompt=prompt)
+        return self._extend_head + _json_str(content) + self._extend_tail
+
+    def generate(
+        self,
+        client: LLMClient | None = None,
+        cancel: CancelHandle | None = None,
+    ) -> list[str]:
+        """Compiled :func:`generate_example_prompts`; never raises."""
+        llm = client or self.client
+        extra = {"cancel": cancel} if cancel is not None else {}
+        prompts = None
+        try:
+            if getattr(llm, "chat_encoded", None) is not None:
+                raw = llm.chat_encoded(self._generate_body, **extra)
+            else:
+                raw = llm.chat(
+                    self._generate_messages,
+                    temperature=self.settings.generate_temperature,
+                    **extra,
+                )
+            prompts = _parse_generated(raw, self.config)
+        except Exception:
+            pass
+        if prompts is None:
+            return random_sample_prompts(self.config.fallback_pool, self.config.count)
+        return prompts
+
+    def extend(
+        self,
+        prompt: str,
+        client: LLMClient | None = None,
+        cache: SimilarityCache | None = None,
+        cancel: CancelHandle | None = None,
+    ) -> str:
+        """Compiled :func:`extend_prompt`; raises :class:`RuntimeError` on failure."""
+        if cache is not None:
+            cached = cache.get(prompt, namespace=self.cache_namespace)
+            if cached is not None:
+                return cached
+
+        llm = client or self.client
+        extra = {"cancel": cancel} if cancel is not None else {}
+        if getattr(llm, "chat_encoded", None) is not None:
+            enhanced = llm.chat_encoded(self.encode_extend(prompt), **extra)
+        else:
+            messages = [
+                {"role": "system", "content": self.config.extend_system_prompt},
+                {
+                    "role": "user",
+                    "content": self.config.extend_user_template.format(prompt=prompt),
+                },
+            ]
+            enhanced = llm.chat(
+                messages, temperature=self.settings.extend_temperature, **extra
+            )
+
+        if cache is not None:
+            cache.put(prompt, enhanced, namespace=self.cache_namespace)
+        return enhanced
+
+
+def compile_config(
+    config: PromptConfig,
+    llm_settings: LLMSettings | None = None,
+    client: LLMClient | None = None,
+) -> CompiledConfig:
+    """Compile *config* and *llm_settings* for repeated generate/extend calls."""
+    return CompiledConfig(config, llm_settings, client)
@@ -2,15 +2,39 @@
 
 from __future__ import annotations
 
+import json
 import os
+import threading
 from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
 
-try:
-    from dotenv import load_dotenv
+if TYPE_CHECKING:
+    from pathlib import Path
 
-    load_dotenv()
-except ImportError:
-    pass
+_dotenv_loaded = False
+_dotenv_lock = threading.Lock()
+
+
+def _env(name: str, default: str) -> str:
+    """Return env var *name*, loading ``.env`` on the first settings lookup.
+
+    Deferring :func:`dotenv.load_dotenv` keeps importing the package free
+    of filesystem access for processes that never resolve settings.
+    Other threads wait until the load has finished, so none of them
+    read the environment before ``.env`` is applied.
+    """
+    global _dotenv_loaded
+    if not _dotenv_loaded:
+        with _dotenv_lock:
+            if not _dotenv_loaded:
+                try:
+                    from dotenv import load_dotenv
+
+                    load_dotenv()
+                except ImportError:
+                    pass
+                _dotenv_loaded = True
+    return os.environ.get(name, default)
 
 
 @dataclass
@@ -18,29 +42,29 @@ class LLMSettings:
     """LLM endpoint settings, loaded from ``PROMPT_LLM_*`` env vars."""
 
     base_url: str = field(
-        default_factory=lambda: os.environ.get(
+        default_factory=lambda: _env(
             "PROMPT_LLM_BASE_URL", "http://localhost:8000/v1"
         )
     )
     model: str = field(
-        default_factory=lambda: os.environ.get(
+        default_factory=lambda: _env(
             "PROMPT_LLM_MODEL", "openai/gpt-oss-120b"
         )
     )
     api_key: str = field(
-        default_factory=lambda: os.environ.get("PROMPT_LLM_API_KEY", "")
+        default_factory=lambda: _env("PROMPT_LLM_API_KEY", "")
     )
     timeout: int = field(
-        default_factory=lambda: int(os.environ.get("PROMPT_LLM_TIMEOUT", "45"))
+        default_factory=lambda: int(_env("PROMPT_LLM_TIMEOUT", "45"))
     )
     generate_temperature: float = field(
         default_factory=lambda: float(
-            os.environ.get("PROMPT_LLM_GENERATE_TEMPERATURE", "0.9")
+            _env("PROMPT_LLM_GENERATE_TEMPERATURE", "0.9")
         )
     )
     extend_temperature: float = field(
         default_factory=lambda: float(
-            os.environ.get("PROMPT_LLM_EXTEND_TEMPERATURE", "0.7")
+            _env("PROMPT_LLM_EXTEND_TEMPERATURE", "0.7")
         )
     )
 
@@ -70,3 +94,40 @@ class PromptConfig:
     )
     fallback_pool: list[str] = field(default_factory=list)
     count: int = 3
+
+
+def check_extend_template(template: str) -> None:
+    """Raise :class:`ValueError` unless *template* formats with only ``prompt``."""
+    try:
+        template.format(prompt="")
+    except (AttributeError, IndexError, KeyError, TypeError, ValueError) as exc:
+        raise ValueError(
+            f"extend_user_template must only use the {{prompt}} field: {exc!r}"
+        ) from exc
+
+
+def load_prompt_configs(path: str | Path) -> dict[str, PromptConfig]:
+    """Load named :class:`PromptConfig` objects from a JSON file.
+
+    The file must hold an object mapping each config name to an object
+    of ``PromptConfig`` fields; omitted fields keep their defaults.
+    Raises :class:`ValueError` for malformed entries, including an
+    ``extend_user_template`` with fields other than ``{prompt}``.
+    """
+    with open(path, encoding="utf-8") as fh:
+        data = json.load(fh)
+    if not isinstance(data, dict):
+        raise ValueError(f"{path}: expected a JSON object of named configs")
+    configs: dict[str, PromptConfig] = {}
+    for name, fields in data.items():
+        if not isinstance(fields, dict):
+            raise ValueError(f"{path}: config {name!r} must be a JSON object")
+        try:
+            configs[name] = PromptConfig(**fields)
+        except TypeError as exc:
+            raise ValueError(f"{path}: config {name!r}: {exc}") from exc
+        try:
+            check_extend_template(configs[name].extend_user_template)
+        except ValueError as exc:
+            raise ValueError(f"{path}: config {name!r}: {exc}") from exc
+    return configs
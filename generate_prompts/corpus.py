@@ -0,0 +1,253 @@
+"""Bulk offline generation of prompt corpora for use as fallback pools."""
+
+from __future__ import annotations
+
+import json
+import re
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import replace
+from pathlib import Path
+from typing import Callable
+
+from .cancellation import CancelHandle
+from .client import LLMClient, RemoteLLMClient
+from .compiled import CompiledConfig
+from .config import LLMSettings, PromptConfig
+from .normalizer import PLACEHOLDER_PROMPT
+
+_SPACE_RE = re.compile(r"\s+")
+
+
+def _dedup_key(prompt: str) -> str:
+    return _SPACE_RE.sub(" ", prompt.casefold()).strip().rstrip(".!?")
+
+
+def _repair_tail(path: Path) -> None:
+    """Fix a last line left without a newline, e.g. by an interrupted run.
+
+    A tail that is a complete JSON record gets its missing newline; any
+    other tail is a partial write and is truncated.
+    """
+    if not path.exists():
+        return
+    with path.open("rb+") as fh:
+        size = fh.seek(0, 2)
+        if size == 0:
+            return
+        fh.seek(size - 1)
+        if fh.read(1) == b"\n":
+            return
+        # Scan back in blocks to the last newline; the tail starts after it.
+        start = 0
+        end = size
+        while end > 0:
+            block_start = max(0, end - 4096)
+            fh.seek(block_start)
+            cut = fh.read(end - block_start).rfind(b"\n")
+            if cut != -1:
+                start = block_start + cut + 1
+                break
+            end = block_start
+        fh.seek(start)
+        try:
+            json.loads(fh.read(size - start))
+        except ValueError:
+            fh.truncate(start)
+        else:
+            fh.seek(size)
+            fh.write(b"\n")
+
+
+def read_corpus(path: str | Path) -> list[dict[str, str]]:
+    """Return the records of a corpus JSONL file, or ``[]`` if it is missing.
+
+    Blank and malformed lines (e.g. a line cut short by an interrupted
+    run) are skipped.
+    """
+    path = Path(path)
+    if not path.exists():
+        return []
+    records: list[dict[str, str]] = []
+    with path.open(encoding="utf-8") as fh:
+        for line in fh:
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            if isinstance(record, dict) and record.get("prompt"):
+                records.append(record)
+    return records
+
+
+def load_fallback_pool(
+    path: str | Path,
+    config_name: str | None = None,
+    field: str = "prompt",
+) -> list[str]:
+    """Load a corpus file as a list suitable for ``PromptConfig.fallback_pool``.
+
+    Parameters
+    ----------
+    path:
+        Corpus JSONL file written by :func:`build_corpus`.
+    config_name:
+        Only return prompts generated for this config.  ``None`` returns all.
+    field:
+        ``"prompt"`` for the generated prompts or ``"extended"`` for their
+        enhanced versions (records without that field are skipped).
+    """
+    return [
+        record[field]
+        for record in read_corpus(path)
+        if (config_name is None or record.get("config") == config_name)
+        and record.get(field)
+    ]
+
+
+def build_corpus(
+    configs: dict[str, PromptConfig],
+    output: str | Path,
+    target: int,
+    extend: bool = False,
+    llm_settings: LLMSettings | None = None,
+    client: LLMClient | None = None,
+    workers: int = 8,
+    max_stale_rounds: int = 20,
+    on_record: Callable[[dict[str, str]], None] | None = None,
+) -> dict[str, int]:
+    """Generate up to *target* unique prompts per config into *output*.
+
+    Each accepted prompt is appended to the JSONL file as soon as it is
+    ready, so the file doubles as the checkpoint: rerunning with the
+    same *output* counts and de-duplicates the existing records and
+    only generates what is still missing.
+
+    A config stops early after *max_stale_rounds* consecutive generate
+    calls that yield no new prompt, or failed extensions (e.g. the LLM
+    is unreachable or the domain is exhausted).  Fallback/placeholder
+    prompts are never written.  With *extend*, each new prompt is also
+    passed through :func:`extend_prompt`; prompts whose extension fails
+    are dropped.
+
+    In-flight requests made through an :class:`LLMClient` or
+    :class:`RemoteLLMClient` are cancelled when the function exits,
+    so an interrupted run stops promptly.
+
+    Returns the number of records per config in the file.
+    """
+    settings = llm_settings or LLMSettings()
+    llm = client or LLMClient(settings)
+    # Generate without a fallback pool so failures surface as placeholders
+    # instead of filling the corpus with the existing pool.
+    gen_configs = {
+        name: CompiledConfig(replace(cfg, fallback_pool=[]), settings, llm)
+        for name, cfg in configs.items()
+    }
+    ext_configs = (
+        {name: CompiledConfig(cfg, settings, llm) for name, cfg in configs.items()}
+        if extend
+        else {}
+    )
+
+    output = Path(output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    _repair_tail(output)
+
+    seen: dict[str, set[str]] = {name: set() for name in configs}
+    counts = dict.fromkeys(configs, 0)
+    for record in read_corpus(output):
+        name = record.get("config")
+        if name in seen:
+            key = _dedup_key(record["prompt"])
+            if key not in seen[name]:
+                seen[name].add(key)
+                counts[name] += 1
+
+    stale = dict.fromkeys(configs, 0)
+    generating = dict.fromkeys(configs, 0)
+    extending = dict.fromkeys(configs, 0)
+    pending: dict[Future, tuple[str, str, str | None]] = {}
+
+    def remaining(name: str) -> int:
+        return target - counts[name] - extending[name]
+
+    def wants_more(name: str) -> bool:
+        if remaining(name) <= 0 or stale[name] >= max_stale_rounds:
+            return False
+        per_call = max(configs[name].count, 1)
+        return generating[name] * per_call < remaining(name)
+
+    # One handle for every call, cancelled on exit (e.g. KeyboardInterrupt)
+    # so in-flight requests do not keep the worker threads alive.  Custom
+    # clients may not accept ``cancel`` and are left to finish.
+    cancel = CancelHandle()
+    extra = (
+        {"cancel": cancel}
+        if isinstance(llm, (LLMClient, RemoteLLMClient))
+        else {}
+    )
+    pool = ThreadPoolExecutor(max_workers=workers)
+    try:
+        with output.open("a", encoding="utf-8") as fh:
+
+            def write(record: dict[str, str]) -> None:
+                fh.write(json.dumps(record, ensure_ascii=False) + "\n")
+                fh.flush()
+                counts[record["config"]] += 1
+                if on_record is not None:
+                    on_record(record)
+
+            while True:
+                topped_up = True
+                while len(pending) < workers and topped_up:
+                    topped_up = False
+                    for name in configs:
+                        if len(pending) < workers and wants_more(name):
+                            future = pool.submit(gen_configs[name].generate, **extra)
+                            pending[future] = ("generate", name, None)
+                            generating[name] += 1
+                            topped_up = True
+                if not pending:
+                    break
+
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    kind, name, prompt = pending.pop(future)
+                    if kind == "generate":
+                        generating[name] -= 1
+                        need = remaining(name)
+                        fresh: list[str] = []
+                        for candidate in future.result():
+                            key = _dedup_key(candidate)
+                            if (
+                                candidate == PLACEHOLDER_PROMPT
+                                or key in seen[name]
+                                or len(fresh) >= need
+                            ):
+                                continue
+                            seen[name].add(key)
+                            fresh.append(candidate)
+                        stale[name] = 0 if fresh else stale[name] + 1
+                        for candidate in fresh:
+                            if extend:
+                                ext = pool.submit(
+                                    ext_configs[name].extend, candidate, **extra
+                                )
+                                pending[ext] = ("extend", name, candidate)
+                                extending[name] += 1
+                            else:
+                                write({"config": name, "prompt": candidate})
+                    else:
+                        extending[name] -= 1
+                        try:
+                            enhanced = future.result()
+                        except RuntimeError:
+                            seen[name].discard(_dedup_key(prompt))
+                            stale[name] += 1
+                            continue
+                        write({"config": name, "prompt": prompt, "extended": enhanced})
+    finally:
+        cancel.cancel()
+        pool.shutdown(wait=False, cancel_futures=True)
+
+    return counts
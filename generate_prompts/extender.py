@@ -2,22 +2,49 @@
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 from .client import LLMClient
 from .config import LLMSettings, PromptConfig
 
+if TYPE_CHECKING:
+    from .cancellation import CancelHandle
+    from .similarity_cache import SimilarityCache
+
+
+def _cache_namespace(config: PromptConfig, settings: LLMSettings) -> str:
+    """Cache namespace so enhancements are only reused for the same model/prompts."""
+    return "\0".join(
+        (settings.model, config.extend_system_prompt, config.extend_user_template)
+    )
+
 
 def extend_prompt(
     prompt: str,
     config: PromptConfig,
     llm_settings: LLMSettings | None = None,
     client: LLMClient | None = None,
+    cache: SimilarityCache | None = None,
+    cancel: CancelHandle | None = None,
 ) -> str:
     """Enhance *prompt* using the LLM described by *config*.
 
+    If *cache* is given, a stored enhancement of a near-identical prompt
+    (same model and extend prompts) is returned without calling the LLM,
+    and fresh results are added to it.  Cancelling *cancel* closes the
+    request's connection and raises :class:`RequestCancelled`.
+
     Raises :class:`RuntimeError` on any failure — the caller is
     expected to show the error to the user who is actively waiting.
     """
     settings = llm_settings or LLMSettings()
+
+    namespace = _cache_namespace(config, settings)
+    if cache is not None:
+        cached = cache.get(prompt, namespace=namespace)
+        if cached is not None:
+            return cached
+
     llm = client or LLMClient(settings)
 
     messages = [
@@ -28,4 +55,10 @@ def extend_prompt(
         },
     ]
 
-    return llm.chat(messages, temperature=settings.extend_temperature)
+    extra = {"cancel": cancel} if cancel is not None else {}
+    enhanced = llm.chat(
+        messages, temperature=settings.extend_temperature, **extra
+    )
+    if cache is not None:
+        cache.put(prompt, enhanced, namespace=namespace)
+    return enhanced
@@ -10,18 +10,35 @@ from .config import LLMSettings, PromptConfig
 from .normalizer import normalize_prompts, random_sample_prompts
 
 if TYPE_CHECKING:
-    pass
+    from .cancellation import CancelHandle
+
+
+def _parse_generated(raw: str, config: PromptConfig) -> list[str] | None:
+    """Parse an LLM reply into *config.count* prompts, or ``None`` if unusable."""
+    cleaned = raw.strip().strip("`")
+    if cleaned.startswith("json"):
+        cleaned = cleaned[4:].strip()
+    parsed = json.loads(cleaned)
+    if isinstance(parsed, list):
+        prompts = [str(item).strip() for item in parsed if str(item).strip()]
+        return normalize_prompts(
+            prompts, count=config.count, fallback_pool=config.fallback_pool
+        )
+    return None
 
 
 def generate_example_prompts(
     config: PromptConfig,
     llm_settings: LLMSettings | None = None,
     client: LLMClient | None = None,
+    cancel: CancelHandle | None = None,
 ) -> list[str]:
     """Generate example prompts for a domain described by *config*.
 
     On any LLM failure the function falls back silently to
-    ``config.fallback_pool`` so callers never see an exception.
+    ``config.fallback_pool`` so callers never see an exception.  This
+    includes cancellation through *cancel*, which closes the request's
+    connection instead of waiting for the reply.
     """
     settings = llm_settings or LLMSettings()
     llm = client or LLMClient(settings)
@@ -33,17 +50,12 @@ def generate_example_prompts(
     ]
 
     try:
-        raw = llm.chat(messages, temperature=settings.generate_temperature)
-        cleaned = raw.strip().strip("`")
-        if cleaned.startswith("json"):
-            cleaned = cleaned[4:].strip()
-        parsed = json.loads(cleaned)
-        if isinstance(parsed, list):
-            prompts = [str(item).strip() for item in parsed if str(item).strip()]
-            return normalize_prompts(
-                prompts, count=config.count, fallback_pool=config.fallback_pool
-            )
+        extra = {"cancel": cancel} if cancel is not None else {}
+        raw = llm.chat(
+            messages, temperature=settings.generate_temperature, **extra
+        )
+        prompts = _parse_generated(raw, config)
     except Exception:
         return fallback
 
-    return fallback
+    return prompts if prompts is not None else fallback
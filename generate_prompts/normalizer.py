@@ -4,6 +4,8 @@ from __future__ import annotations
 
 import random
 
+PLACEHOLDER_PROMPT = "Sample prompt unavailable."
+
 
 def normalize_prompts(
     prompts: list[str],
@@ -27,7 +29,7 @@ def normalize_prompts(
 
     # Last-resort padding with placeholder text
     while len(cleaned) < count:
-        cleaned.append("Sample prompt unavailable.")
+        cleaned.append(PLACEHOLDER_PROMPT)
 
     return cleaned[:count]
 
@@ -38,7 +40,7 @@ def random_sample_prompts(
 ) -> list[str]:
     """Return *count* random prompts from *pool*, with replacement if needed."""
     if not pool:
-        return ["Sample prompt unavailable."] * count
+        return [PLACEHOLDER_PROMPT] * count
     if len(pool) >= count:
         return random.sample(pool, count)
     return [random.choice(pool) for _ in range(count)]
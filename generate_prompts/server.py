@@ -0,0 +1,350 @@
+"""Standalone prompt service sharing one client, cache and rate limiter."""
+
+from __future__ import annotations
+
+import json
+import select
+import socket
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+
+from .cancellation import CancelHandle, RequestCancelled
+from .client import LLMClient
+from .compiled import CompiledConfig
+from .config import LLMSettings, PromptConfig, check_extend_template
+from .similarity_cache import SimilarityCache
+
+_MAX_BODY = 1 << 20
+_DISCONNECT_POLL = 0.2
+
+
+class UnknownConfigError(LookupError):
+    """Raised by :class:`PromptService` for a config name it does not serve."""
+
+
+class _BadRequest(Exception):
+    """Malformed request body; answered with 400."""
+
+
+class RateLimiter:
+    """Token-bucket limiter allowing *rate* calls per second with bursts.
+
+    At most *max_concurrency* calls are in flight at once; ``rate <= 0``
+    disables the per-second limit.
+    """
+
+    def __init__(
+        self,
+        rate: float = 0.0,
+        burst: int = 1,
+        max_concurrency: int = 16,
+    ) -> None:
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        self.rate = rate
+        self.burst = max(burst, 1)
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(max_concurrency)
+
+    def __enter__(self) -> RateLimiter:
+        self._slots.acquire()
+        if self.rate > 0:
+            self._take_token()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self._slots.release()
+
+    def _take_token(self) -> None:
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.burst, self._tokens + (now - self._updated) * self.rate
+                )
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+class _LimitedClient:
+    """Wraps an :class:`LLMClient` so every upstream call passes the limiter."""
+
+    def __init__(self, client: LLMClient, limiter: RateLimiter) -> None:
+        self._client = client
+        self._limiter = limiter
+
+    def chat(
+        self,
+        messages: list[dict[str, str]],
+        temperature: float | None = None,
+        cancel: CancelHandle | None = None,
+    ) -> str:
+        with self._limiter:
+            return self._client.chat(messages, temperature, cancel)
+
+    def chat_encoded(
+        self, data: bytes, cancel: CancelHandle | None = None
+    ) -> str:
+        with self._limiter:
+            return self._client.chat_encoded(data, cancel)
+
+
+class PromptService:
+    """Named prompt configs served over one shared client, cache and limiter."""
+
+    def __init__(
+        self,
+        configs: dict[str, PromptConfig],
+        llm_settings: LLMSettings | None = None,
+        limiter: RateLimiter | None = None,
+        cache: SimilarityCache | None = None,
+    ) -> None:
+        for config in configs.values():
+            check_extend_template(config.extend_user_template)
+        self.configs = configs
+        self.settings = llm_settings or LLMSettings()
+        self.limiter = limiter or RateLimiter()
+        self.cache = cache
+        self.client = _LimitedClient(LLMClient(self.settings), self.limiter)
+        self._compiled = {
+            name: CompiledConfig(config, self.settings, self.client)
+            for name, config in configs.items()
+        }
+
+    def _config(self, name: str) -> CompiledConfig:
+        try:
+            return self._compiled[name]
+        except KeyError:
+            raise UnknownConfigError(f"unknown config: {name!r}") from None
+
+    def chat(
+        self,
+        messages: list[dict[str, str]],
+        temperature: float | None = None,
+        cancel: CancelHandle | None = None,
+    ) -> str:
+        return self.client.chat(messages, temperature, cancel)
+
+    def generate(
+        self, config_name: str, cancel: CancelHandle | None = None
+    ) -> list[str]:
+        return self._config(config_name).generate(cancel=cancel)
+
+    def extend(
+        self, prompt: str, config_name: str, cancel: CancelHandle | None = None
+    ) -> str:
+        return self._config(config_name).extend(
+            prompt, cache=self.cache, cancel=cancel
+        )
+
+    def stats(self) -> dict:
+        info: dict = {"configs": sorted(self.configs)}
+        if self.cache is not None:
+            info["cache"] = {
+                "entries": len(self.cache),
+                "hits": self.cache.stats.hits,
+                "misses": self.cache.stats.misses,
+                "evictions": self.cache.stats.evictions,
+                "hit_rate": self.cache.stats.hit_rate,
+            }
+        return info
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server: _PromptHTTPServer
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self) -> None:
+        if self.path == "/health":
+            self._reply(200, {"status": "ok"})
+        elif self.path == "/stats":
+            self._reply(200, self.server.service.stats())
+        else:
+            self._reply(404, {"error": f"no such endpoint: {self.path}"})
+
+    def do_POST(self) -> None:
+        try:
+            payload = self._read_payload()
+        except _BadRequest as exc:
+            self._reply(400, {"error": str(exc)})
+            return
+
+        # Start watching only once the body is consumed, so unread body
+        # bytes are not mistaken for the next request.
+        cancel = CancelHandle()
+        done = threading.Event()
+        watcher = threading.Thread(
+            target=self._cancel_on_disconnect, args=(cancel, done), daemon=True
+        )
+        watcher.start()
+        try:
+            self._handle_post(payload, cancel)
+        finally:
+            done.set()
+            watcher.join()
+
+    def _cancel_on_disconnect(
+        self, cancel: CancelHandle, done: threading.Event
+    ) -> None:
+        """Cancel the upstream request if the client closes its connection."""
+        sock = self.connection
+        while not done.is_set():
+            try:
+                readable, _, _ = select.select([sock], [], [], _DISCONNECT_POLL)
+                if not readable:
+                    continue
+                if sock.recv(1, socket.MSG_PEEK) == b"":
+                    cancel.cancel()
+            except OSError:
+                cancel.cancel()
+            # Either the client is gone or it sent (pipelined) data we
+            # must not consume; stop watching in both cases.
+            return
+
+    def _handle_post(self, payload: dict, cancel: CancelHandle) -> None:
+        service = self.server.service
+        try:
+            if self.path == "/generate":
+                result = {
+                    "prompts": service.generate(
+                        _field(payload, "config", str), cancel
+                    )
+                }
+            elif self.path == "/extend":
+                result = {
+                    "prompt": service.extend(
+                        _field(payload, "prompt", str),
+                        _field(payload, "config", str),
+                        cancel,
+                    )
+                }
+            elif self.path == "/chat":
+                result = {
+                    "text": service.chat(
+                        _messages(payload), _temperature(payload), cancel
+                    )
+                }
+            else:
+                self._reply(404, {"error": f"no such endpoint: {self.path}"})
+                return
+            if cancel.cancelled:
+                raise RequestCancelled("client disconnected")
+        except RequestCancelled:
+            # Nobody is left to answer.
+            self.close_connection = True
+            return
+        except _BadRequest as exc:
+            self._reply(400, {"error": str(exc)})
+            return
+        except UnknownConfigError as exc:
+            self._reply(404, {"error": str(exc)})
+            return
+        except RuntimeError as exc:
+            self._reply(502, {"error": str(exc)})
+            return
+        except Exception as exc:
+            self.log_error("unhandled error for %s: %r", self.path, exc)
+            self._reply(500, {"error": "internal server error"})
+            return
+        self._reply(200, result)
+
+    def _read_payload(self) -> dict:
+        try:
+            length = int(self.headers.get("Content-Length", "0"))
+        except ValueError:
+            raise _BadRequest("invalid Content-Length") from None
+        if not 0 <= length <= _MAX_BODY:
+            raise _BadRequest("request body too large")
+        try:
+            payload = json.loads(self.rfile.read(length) or b"{}")
+        except ValueError as exc:
+            raise _BadRequest(f"invalid JSON: {exc}") from None
+        if not isinstance(payload, dict):
+            raise _BadRequest("request body must be a JSON object")
+        return payload
+
+    def _reply(self, status: int, body: dict) -> None:
+        data = json.dumps(body, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format: str, *args: object) -> None:
+        if not self.server.quiet:
+            super().log_message(format, *args)
+
+
+def _field(payload: dict, name: str, kind: type) -> Any:
+    if name not in payload:
+        raise _BadRequest(f"missing field: {name}")
+    value = payload[name]
+    if not isinstance(value, kind):
+        raise _BadRequest(f"field {name!r} must be a {kind.__name__}")
+    return value
+
+
+def _messages(payload: dict) -> list[dict[str, str]]:
+    messages = _field(payload, "messages", list)
+    for message in messages:
+        if not (
+            isinstance(message, dict)
+            and isinstance(message.get("role"), str)
+            and isinstance(message.get("content"), str)
+        ):
+            raise _BadRequest(
+                "messages must be a list of objects with string role and content"
+            )
+    return messages
+
+
+def _temperature(payload: dict) -> float | None:
+    temperature = payload.get("temperature")
+    if temperature is not None and (
+        isinstance(temperature, bool) or not isinstance(temperature, (int, float))
+    ):
+        raise _BadRequest("field 'temperature' must be a number")
+    return temperature
+
+
+class _PromptHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(
+        self, address: tuple[str, int], service: PromptService, quiet: bool
+    ) -> None:
+        super().__init__(address, _Handler)
+        self.service = service
+        self.quiet = quiet
+
+
+def make_server(
+    service: PromptService,
+    host: str = "127.0.0.1",
+    port: int = 8080,
+    quiet: bool = False,
+) -> ThreadingHTTPServer:
+    """Return an HTTP server exposing *service*; call ``serve_forever()`` on it.
+
+    Endpoints (JSON in, JSON out):
+
+    - ``POST /generate`` ``{"config"}`` → ``{"prompts"}``
+    - ``POST /extend`` ``{"config", "prompt"}`` → ``{"prompt"}``
+    - ``POST /chat`` ``{"messages", "temperature"}`` → ``{"text"}``
+    - ``GET /stats`` and ``GET /health``
+
+    Unknown configs return 404, malformed requests 400, LLM failures
+    502 and unexpected errors 500, each with an ``{"error"}`` body.
+    If a client disconnects while its request is running, the upstream
+    LLM call is cancelled and no reply is sent.
+    """
+    return _PromptHTTPServer((host, port), service, quiet)
@@ -0,0 +1,211 @@
+"""Local near-duplicate cache for extended prompts (MinHash + LSH, stdlib only)."""
+
+from __future__ import annotations
+
+import hashlib
+import random
+import re
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+_TOKEN_RE = re.compile(r"\w+")
+_STOPWORDS = frozenset({"a", "an", "the"})
+
+
+@dataclass
+class CacheStats:
+    """Hit/miss counters for a :class:`SimilarityCache`."""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+    @property
+    def lookups(self) -> int:
+        return self.hits + self.misses
+
+    @property
+    def hit_rate(self) -> float:
+        return self.hits / self.lookups if self.lookups else 0.0
+
+
+@dataclass
+class _Entry:
+    namespace: str
+    shingles: frozenset[str]
+    bands: tuple[tuple[int, ...], ...]
+    value: str
+
+
+def _shingles(text: str, size: int) -> frozenset[str]:
+    """Return word *size*-grams of *text* after case/punctuation/article folding.
+
+    Returns an empty set when *text* has no word characters besides
+    articles, so such prompts never match each other.
+    """
+    tokens = [t for t in _TOKEN_RE.findall(text.casefold()) if t not in _STOPWORDS]
+    if not tokens:
+        return frozenset()
+    if len(tokens) <= size:
+        return frozenset({" ".join(tokens)})
+    return frozenset(
+        " ".join(tokens[i : i + size]) for i in range(len(tokens) - size + 1)
+    )
+
+
+def _jaccard(a: frozenset[str], b: frozenset[str]) -> float:
+    if not a and not b:
+        return 1.0
+    return len(a & b) / len(a | b)
+
+
+class SimilarityCache:
+    """Bounded LRU cache that matches prompts by shingle similarity.
+
+    Prompts are case-folded and split into Unicode word tokens
+    (punctuation and the articles *a*, *an*, *the* dropped) and split into word shingles.
+    A MinHash signature banded into an LSH index finds candidate
+    entries; a candidate is a hit when its exact Jaccard similarity
+    with the lookup is at least *threshold*.
+
+    Parameters
+    ----------
+    threshold:
+        Minimum Jaccard similarity (0-1) for a stored value to be returned.
+    max_entries:
+        Maximum number of stored prompts; the least recently used entry
+        is evicted when the limit is exceeded.
+    num_perm:
+        Number of MinHash permutations.  Must be divisible by *bands*.
+    bands:
+        Number of LSH bands.  More bands find lower-similarity candidates.
+    shingle_size:
+        Number of words per shingle.
+    """
+
+    def __init__(
+        self,
+        threshold: float = 0.8,
+        max_entries: int = 1024,
+        num_perm: int = 64,
+        bands: int = 16,
+        shingle_size: int = 2,
+        seed: int = 1,
+    ) -> None:
+        if not 0.0 < threshold <= 1.0:
+            raise ValueError("threshold must be in (0, 1]")
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        if bands < 1 or num_perm < bands:
+            raise ValueError("bands must be at least 1 and at most num_perm")
+        if num_perm % bands:
+            raise ValueError("num_perm must be divisible by bands")
+        if shingle_size < 1:
+            raise ValueError("shingle_size must be at least 1")
+
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.shingle_size = shingle_size
+        self._rows = num_perm // bands
+        rng = random.Random(seed)
+        self._perms = [
+            (rng.randrange(1, _MERSENNE_PRIME), rng.randrange(0, _MERSENNE_PRIME))
+            for _ in range(num_perm)
+        ]
+        self._entries: OrderedDict[int, _Entry] = OrderedDict()
+        self._buckets: dict[tuple[str, int, tuple[int, ...]], set[int]] = {}
+        self._next_id = 0
+        self._lock = threading.Lock()
+        self.stats = CacheStats()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, prompt: str, namespace: str = "") -> str | None:
+        """Return the stored value for the most similar prompt, or ``None``."""
+        shingles = _shingles(prompt, self.shingle_size)
+        if not shingles:
+            with self._lock:
+                self.stats.misses += 1
+            return None
+        bands = self._bands(shingles)
+        with self._lock:
+            best_id: int | None = None
+            best_score = 0.0
+            for entry_id in self._candidates(namespace, bands):
+                score = _jaccard(shingles, self._entries[entry_id].shingles)
+                if score >= self.threshold and score > best_score:
+                    best_id, best_score = entry_id, score
+            if best_id is None:
+                self.stats.misses += 1
+                return None
+            self._entries.move_to_end(best_id)
+            self.stats.hits += 1
+            return self._entries[best_id].value
+
+    def put(self, prompt: str, value: str, namespace: str = "") -> None:
+        """Store *value* for *prompt*, replacing any identical normalised prompt.
+
+        Prompts without any word characters are not stored.
+        """
+        shingles = _shingles(prompt, self.shingle_size)
+        if not shingles:
+            return
+        bands = self._bands(shingles)
+        with self._lock:
+            for entry_id in self._candidates(namespace, bands):
+                if self._entries[entry_id].shingles == shingles:
+                    self._remove(entry_id)
+            entry_id = self._next_id
+            self._next_id += 1
+            self._entries[entry_id] = _Entry(namespace, shingles, bands, value)
+            for idx, band in enumerate(bands):
+                self._buckets.setdefault((namespace, idx, band), set()).add(entry_id)
+            while len(self._entries) > self.max_entries:
+                self._remove(next(iter(self._entries)))
+                self.stats.evictions += 1
+
+    def clear(self) -> None:
+        """Drop all entries and reset the statistics."""
+        with self._lock:
+            self._entries.clear()
+            self._buckets.clear()
+            self.stats = CacheStats()
+
+    def _signature(self, shingles: frozenset[str]) -> list[int]:
+        hashes = [
+            int.from_bytes(
+                hashlib.blake2b(s.encode("utf-8"), digest_size=4).digest(), "big"
+            )
+            for s in shingles
+        ]
+        return [
+            min(((a * h + b) % _MERSENNE_PRIME) & _MAX_HASH for h in hashes)
+            for a, b in self._perms
+        ]
+
+    def _bands(self, shingles: frozenset[str]) -> tuple[tuple[int, ...], ...]:
+        sig = self._signature(shingles)
+        rows = self._rows
+        return tuple(tuple(sig[i : i + rows]) for i in range(0, len(sig), rows))
+
+    def _candidates(
+        self, namespace: str, bands: tuple[tuple[int, ...], ...]
+    ) -> set[int]:
+        found: set[int] = set()
+        for idx, band in enumerate(bands):
+            found |= self._buckets.get((namespace, idx, band), set())
+        return found
+
+    def _remove(self, entry_id: int) -> None:
+        entry = self._entries.pop(entry_id)
+        for idx, band in enumerate(entry.bands):
+            key = (entry.namespace, idx, band)
+            bucket = self._buckets.get(key)
+            if bucket is not None:
+                bucket.discard(entry_id)
+                if not bucket:
+                    del self._buckets[key]
@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Callable
+import threading
+from typing import TYPE_CHECKING, Any, Callable, TypeVar
 
 from .animation import (
     AnimationFrame,
@@ -10,10 +11,15 @@ from .animation import (
     render_slot_css,
     render_static_card,
 )
+from .cancellation import CancelHandle
 
 if TYPE_CHECKING:
     pass
 
+T = TypeVar("T")
+
+_HANDLES_KEY = "_generate_prompts_cancel_handles"
+
 
 def inject_slot_css() -> None:
     """Inject the slot-machine CSS into the current Streamlit page."""
@@ -67,3 +73,74 @@ def render_prompt_cards(
                     use_container_width=True,
                 ):
                     on_use(prompt)
+
+
+def run_cancellable(
+    fn: Callable[..., T],
+    *args: Any,
+    key: str,
+    poll_interval: float = 0.1,
+    **kwargs: Any,
+) -> T:
+    """Call ``fn(*args, cancel=handle, **kwargs)`` and cancel it when superseded.
+
+    Use for :func:`generate_example_prompts`, :func:`extend_prompt` or any
+    function taking a ``cancel`` handle.  At most one call per *key* is
+    in flight for each session: starting a new call cancels the
+    previous one.  The call runs in a worker thread while this script
+    run polls a placeholder every *poll_interval* seconds, which lets
+    Streamlit stop the run on a rerun (a new button click, a changed
+    domain) — the request is then cancelled and its socket closed
+    instead of running to completion.
+
+    Returns the function's result, or re-raises its exception.
+    """
+    import streamlit as st
+
+    handles: dict[str, CancelHandle] = st.session_state.setdefault(_HANDLES_KEY, {})
+    previous = handles.get(key)
+    if previous is not None:
+        previous.cancel()
+    handle = CancelHandle()
+    handles[key] = handle
+
+    outcome: dict[str, Any] = {}
+
+    def worker() -> None:
+        try:
+            outcome["result"] = fn(*args, cancel=handle, **kwargs)
+        except BaseException as exc:
+            outcome["error"] = exc
+
+    thread = threading.Thread(target=worker, daemon=True)
+    thread.start()
+    placeholder = st.empty()
+    try:
+        while thread.is_alive():
+            thread.join(poll_interval)
+            # Any element update gives Streamlit a chance to interrupt
+            # this run if a rerun or stop has been requested.
+            placeholder.empty()
+    finally:
+        if thread.is_alive():
+            handle.cancel()
+        if handles.get(key) is handle:
+            del handles[key]
+
+    if "error" in outcome:
+        raise outcome["error"]
+    return outcome["result"]
+
+
+def cancel_pending(key: str | None = None) -> None:
+    """Cancel this session's in-flight :func:`run_cancellable` call for *key*.
+
+    With ``key=None`` every pending call of the session is cancelled.
+    """
+    import streamlit as st
+
+    handles: dict[str, CancelHandle] = st.session_state.get(_HANDLES_KEY, {})
+    for name in [key] if key is not None else list(handles):
+        handle = handles.pop(name, None)
+        if handle is not None:
+            handle.cancel()
@@ -0,0 +1,27 @@
+"""Enforce the cold-import budget from ``benchmarks/bench_import.py``."""
+
+from __future__ import annotations
+
+import importlib.util
+import statistics
+from pathlib import Path
+
+import pytest
+
+_BENCH = Path(__file__).resolve().parent.parent / "benchmarks" / "bench_import.py"
+_spec = importlib.util.spec_from_file_location("bench_import", _BENCH)
+bench_import = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(bench_import)
+
+
+def test_package_import_has_no_side_effects() -> None:
+    assert bench_import._loaded_forbidden() == []
+
+
+@pytest.mark.parametrize("module", sorted(bench_import.BUDGETS_MS))
+def test_import_time_within_budget(module: str) -> None:
+    median = statistics.median(bench_import._import_ms(module) for _ in range(5))
+    assert median <= bench_import.BUDGETS_MS[module], (
+        f"import {module} took {median:.1f} ms "
+        f"(budget {bench_import.BUDGETS_MS[module]} ms)"
+    )
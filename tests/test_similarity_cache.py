@@ -0,0 +1,33 @@
+"""Tests for :class:`SimilarityCache` tokenisation edge cases."""
+
+from __future__ import annotations
+
+import pytest
+
+from generate_prompts import SimilarityCache
+
+
+@pytest.mark.parametrize(
+    ("stored", "other"),
+    [
+        ("Кошка в саду на закате", "Собака на луне ночью"),
+        ("一只猫在花园里", "宇宙飞船降落在火星"),
+        ("Un café au lait", "Un thé au citron"),
+    ],
+)
+def test_non_ascii_prompts_do_not_collide(stored: str, other: str) -> None:
+    cache = SimilarityCache()
+    cache.put(stored, "ENH")
+    assert cache.get(other) is None
+    assert cache.get(stored.upper()) == "ENH"
+
+
+@pytest.mark.parametrize("prompt", ["", "the", "a, an... the!", "🎉🎉"])
+def test_prompts_without_words_never_match(prompt: str) -> None:
+    cache = SimilarityCache()
+    cache.put(prompt, "ENH")
+    assert len(cache) == 0
+    cache.put("A real prompt", "REAL")
+    assert cache.get(prompt) is None
+    assert cache.get("?!") is None
+    assert cache.stats.misses == 2